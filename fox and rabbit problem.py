@@ -1,133 +1,373 @@
+from collections import namedtuple
+
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.integrate import odeint
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: fall back to plain Python so the script still runs
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# Simulation output: time points and the two population series
+Simulation = namedtuple('Simulation', 'time rabbits foxes')
+
+# Summary of a simulation produced by analyze_ecosystem_dynamics
+Insights = namedtuple('Insights', [
+    'max_rabbits', 'min_rabbits', 'max_foxes', 'min_foxes',
+    'rabbit_peaks', 'fox_peaks', 'avg_rabbit_period', 'avg_fox_period',
+    'phase_lag', 'final_rabbits', 'final_foxes',
+    'rabbit_argmax', 'fox_argmax',
+    'rabbit_mean', 'rabbit_std', 'fox_mean', 'fox_std',
+    'correlation', 'drabbit', 'dfox'
+])
+
+@njit(cache=True, fastmath=True)
 def lotka_volterra_eqn(y, t, alpha, beta, delta, gamma):
     """
     Lotka-Volterra equations for predator-prey dynamics
     y[0] = prey population (rabbits)
     y[1] = predator population (foxes)
     """
-    prey, predator = y
+    prey = y[0]
+    predator = y[1]
+    
+    # Encounter term shared by both equations
+    encounters = prey * predator
     
     # Prey equation: dprey/dt = α*prey - β*prey*predator
-    dprey_dt = alpha * prey - beta * prey * predator
+    dprey_dt = alpha * prey - beta * encounters
     
     # Predator equation: dpredator/dt = δ*prey*predator - γ*predator
-    dpredator_dt = delta * prey * predator - gamma * predator
+    dpredator_dt = delta * encounters - gamma * predator
+    
+    return (dprey_dt, dpredator_dt)
+
+@njit(cache=True, fastmath=True)
+def lv_jac(y, t, alpha, beta, delta, gamma):
+    """
+    Analytic Jacobian of the Lotka-Volterra equations, J[i, j] = d(dy[i]/dt)/dy[j]
+    """
+    prey = y[0]
+    predator = y[1]
+    
+    jac = np.empty((2, 2))
+    jac[0, 0] = alpha - beta * predator
+    jac[0, 1] = -beta * prey
+    jac[1, 0] = delta * predator
+    jac[1, 1] = delta * prey - gamma
+    
+    return jac
+
+@njit(cache=True, fastmath=True)
+def _rk4_core(out, prey, predator, t, alpha, beta, delta, gamma):
+    """
+    Fixed-step RK4 integration of the Lotka-Volterra equations, taking one
+    step between consecutive times in t and writing the state into out
+    """
+    out[0, 0] = prey
+    out[0, 1] = predator
+    
+    for i in range(1, len(t)):
+        h = t[i] - t[i - 1]
+        
+        pq = prey * predator
+        k1p = alpha * prey - beta * pq
+        k1q = delta * pq - gamma * predator
+        
+        p = prey + 0.5 * h * k1p
+        q = predator + 0.5 * h * k1q
+        pq = p * q
+        k2p = alpha * p - beta * pq
+        k2q = delta * pq - gamma * q
+        
+        p = prey + 0.5 * h * k2p
+        q = predator + 0.5 * h * k2q
+        pq = p * q
+        k3p = alpha * p - beta * pq
+        k3q = delta * pq - gamma * q
+        
+        p = prey + h * k3p
+        q = predator + h * k3q
+        pq = p * q
+        k4p = alpha * p - beta * pq
+        k4q = delta * pq - gamma * q
+        
+        prey += h / 6 * (k1p + 2 * k2p + 2 * k3p + k4p)
+        predator += h / 6 * (k1q + 2 * k2q + 2 * k3q + k4q)
+        
+        out[i, 0] = prey
+        out[i, 1] = predator
+
+@njit(cache=True, fastmath=True)
+def rk4_lv(y0, t, alpha, beta, delta, gamma):
+    """
+    Integrate the Lotka-Volterra equations with fixed-step RK4, returning
+    the (prey, predator) state at every time in t
+    """
+    out = np.empty((len(t), 2))
+    _rk4_core(out, float(y0[0]), float(y0[1]), t, alpha, beta, delta, gamma)
+    return out
+
+@njit(cache=True, fastmath=True, parallel=True)
+def simulate_many(alpha, beta, delta, gamma, prey0, predator0, t):
+    """
+    Integrate several independent Lotka-Volterra scenarios with RK4, one
+    scenario per thread
+    Every parameter and initial condition is a separate contiguous array
+    indexed by scenario; returns an (nscen, steps, 2) array
+    """
+    nscen = len(alpha)
+    out = np.empty((nscen, len(t), 2))
+    
+    for i in prange(nscen):
+        _rk4_core(out[i], prey0[i], predator0[i], t,
+                  alpha[i], beta[i], delta[i], gamma[i])
     
-    return [dprey_dt, dpredator_dt]
+    return out
+
+def _lv_rhs_julia(u, p, t):
+    """
+    Lotka-Volterra equations in the f(u, p, t) form expected by diffeqpy
+    """
+    # de.jit traces the plain Python function symbolically, so bypass Numba
+    rhs = getattr(lotka_volterra_eqn, 'py_func', lotka_volterra_eqn)
+    return list(rhs(u, t, p[0], p[1], p[2], p[3]))
 
 def simulate_ecosystem(prey_initial=40, predator_initial=9, 
                       prey_growth=0.1, predation_rate=0.02,
                       predator_growth=0.01, predator_death=0.1,
-                      duration=200, steps=1000):
+                      duration=200, steps=1000, backend='numba'):
     """
     Simulate the predator-prey ecosystem dynamics
+    
+    backend='numba' runs the compiled RK4 integrator, backend='odeint'
+    uses scipy's LSODA as a reference solver and backend='julia' hands the
+    problem to DifferentialEquations.jl through diffeqpy (experimental,
+    untested)
     """
     # Time points for simulation
     t = np.linspace(0, duration, steps)
     
     # Initial conditions [prey, predator]
-    y0 = [prey_initial, predator_initial]
+    y0 = np.array([prey_initial, predator_initial], dtype=np.float64)
     
     # Parameters: [prey_growth, predation_rate, predator_growth, predator_death]
     params = (prey_growth, predation_rate, predator_growth, predator_death)
     
     # Solve the differential equations
-    solution = odeint(lotka_volterra_eqn, y0, t, args=params)
+    if backend == 'numba':
+        solution = rk4_lv(y0, t, *params)
+    elif backend == 'odeint':
+        from scipy.integrate import odeint
+        
+        solution = odeint(lotka_volterra_eqn, y0, t, args=params,
+                          Dfun=lv_jac, col_deriv=False)
+    elif backend == 'julia':
+        from diffeqpy import de
+        
+        # p as a list so de.jit traces it as a parameter vector
+        prob = de.ODEProblem(_lv_rhs_julia, y0, (t[0], t[-1]), list(params))
+        fast_prob = de.jit(prob)
+        sol = de.solve(fast_prob, de.Tsit5(), saveat=t, reltol=1e-8, abstol=1e-8)
+        solution = np.array(sol.u)
+    else:
+        raise ValueError(f"Unknown backend: {backend!r}")
     
-    # Create DataFrame with results
-    df = pd.DataFrame({
-        'time': t,
-        'rabbits': solution[:, 0],
-        'foxes': solution[:, 1]
-    })
+    # Split the (steps, 2) solution into contiguous per-species arrays so
+    # the single-species passes downstream read memory sequentially
+    rabbits = np.ascontiguousarray(solution[:, 0])
+    foxes = np.ascontiguousarray(solution[:, 1])
     
-    return df
+    return Simulation(time=t, rabbits=rabbits, foxes=foxes)
 
-def analyze_ecosystem_dynamics(df):
+def simulate_ecosystem_batch(params_array, duration=200, steps=1000):
     """
-    Analyze and provide insights about the ecosystem dynamics
+    Simulate several ecosystems in one pass
+    Each row of params_array is (prey_initial, predator_initial, prey_growth,
+    predation_rate, predator_growth, predator_death), as for simulate_ecosystem;
+    returns an array of shape (nscen, steps, 2)
+    """
+    params_array = np.asarray(params_array, dtype=np.float64)
+    t = np.linspace(0, duration, steps)
+    
+    # One contiguous array per column (structure of arrays)
+    prey0, predator0, alpha, beta, delta, gamma = (
+        np.ascontiguousarray(column) for column in params_array.T)
+    
+    return simulate_many(alpha, beta, delta, gamma, prey0, predator0, t)
+
+@njit(cache=True)
+def _analyze(rabbits, foxes, time):
+    """
+    Single pass over both populations collecting extrema and where they
+    occur, means, standard deviations and their correlation, first
+    differences, peak counts and the timing of the first and last peaks
     """
-    rabbits = df['rabbits'].values
-    foxes = df['foxes'].values
-    time = df['time'].values
+    n = len(rabbits)
+    drabbit = np.empty(n - 1)
+    dfox = np.empty(n - 1)
+    
+    max_rabbits = min_rabbits = rabbits[0]
+    max_foxes = min_foxes = foxes[0]
+    rabbit_argmax = fox_argmax = 0
+    
+    # Running means, sums of squared deviations and co-moment (Welford)
+    rabbit_mean = rabbits[0]
+    fox_mean = foxes[0]
+    rabbit_m2 = fox_m2 = comoment = 0.0
     
-    # Find peaks and troughs
-    from scipy.signal import find_peaks
+    rabbit_peaks = fox_peaks = 0
+    rabbit_first = rabbit_last = fox_first = fox_last = 0.0
     
-    rabbit_peaks, _ = find_peaks(rabbits)
-    fox_peaks, _ = find_peaks(foxes)
-    rabbit_troughs, _ = find_peaks(-rabbits)
-    fox_troughs, _ = find_peaks(-foxes)
+    # First differences ending at the previous sample, carried between
+    # iterations so each element is differenced only once
+    rabbit_rise = fox_rise = 0.0
+    
+    for i in range(1, n):
+        r = rabbits[i]
+        f = foxes[i]
+        
+        if r > max_rabbits:
+            max_rabbits = r
+            rabbit_argmax = i
+        elif r < min_rabbits:
+            min_rabbits = r
+        if f > max_foxes:
+            max_foxes = f
+            fox_argmax = i
+        elif f < min_foxes:
+            min_foxes = f
+        
+        rabbit_dev = r - rabbit_mean
+        rabbit_mean += rabbit_dev / (i + 1)
+        rabbit_m2 += rabbit_dev * (r - rabbit_mean)
+        fox_dev = f - fox_mean
+        fox_mean += fox_dev / (i + 1)
+        fox_m2 += fox_dev * (f - fox_mean)
+        comoment += rabbit_dev * (f - fox_mean)
+        
+        # The previous sample is a peak where the first difference
+        # changes sign from + to -
+        r_rise = r - rabbits[i - 1]
+        f_rise = f - foxes[i - 1]
+        drabbit[i - 1] = r_rise
+        dfox[i - 1] = f_rise
+        if rabbit_rise > 0.0 and r_rise < 0.0:
+            if rabbit_peaks == 0:
+                rabbit_first = time[i - 1]
+            rabbit_last = time[i - 1]
+            rabbit_peaks += 1
+        if fox_rise > 0.0 and f_rise < 0.0:
+            if fox_peaks == 0:
+                fox_first = time[i - 1]
+            fox_last = time[i - 1]
+            fox_peaks += 1
+        rabbit_rise = r_rise
+        fox_rise = f_rise
+    
+    rabbit_std = np.sqrt(rabbit_m2 / n)
+    fox_std = np.sqrt(fox_m2 / n)
+    
+    # Pearson correlation between the two populations
+    spread = np.sqrt(rabbit_m2 * fox_m2)
+    correlation = comoment / spread if spread > 0.0 else np.nan
     
     # Calculate phase relationship
-    if len(rabbit_peaks) > 1 and len(fox_peaks) > 1:
-        rabbit_period = np.mean(np.diff(time[rabbit_peaks]))
-        fox_period = np.mean(np.diff(time[fox_peaks]))
-        phase_lag = (time[fox_peaks[0]] - time[rabbit_peaks[0]]) if len(rabbit_peaks) > 0 and len(fox_peaks) > 0 else 0
+    if rabbit_peaks > 1 and fox_peaks > 1:
+        rabbit_period = (rabbit_last - rabbit_first) / (rabbit_peaks - 1)
+        fox_period = (fox_last - fox_first) / (fox_peaks - 1)
+        phase_lag = fox_first - rabbit_first
     else:
-        rabbit_period = fox_period = phase_lag = 0
-    
-    insights = {
-        'max_rabbits': np.max(rabbits),
-        'min_rabbits': np.min(rabbits),
-        'max_foxes': np.max(foxes),
-        'min_foxes': np.min(foxes),
-        'rabbit_peaks': len(rabbit_peaks),
-        'fox_peaks': len(fox_peaks),
-        'avg_rabbit_period': rabbit_period,
-        'avg_fox_period': fox_period,
-        'phase_lag': phase_lag,
-        'final_rabbits': rabbits[-1],
-        'final_foxes': foxes[-1]
-    }
+        rabbit_period = fox_period = phase_lag = 0.0
+    
+    return (max_rabbits, min_rabbits, max_foxes, min_foxes,
+            rabbit_argmax, fox_argmax,
+            rabbit_mean, rabbit_std, fox_mean, fox_std, correlation,
+            drabbit, dfox,
+            rabbit_peaks, fox_peaks, rabbit_period, fox_period, phase_lag)
+
+def analyze_ecosystem_dynamics(sim):
+    """
+    Analyze and provide insights about the ecosystem dynamics
+    """
+    rabbits = sim.rabbits
+    foxes = sim.foxes
+    time = sim.time
+    
+    (max_rabbits, min_rabbits, max_foxes, min_foxes,
+     rabbit_argmax, fox_argmax,
+     rabbit_mean, rabbit_std, fox_mean, fox_std, correlation,
+     drabbit, dfox,
+     rabbit_peaks, fox_peaks, rabbit_period, fox_period,
+     phase_lag) = _analyze(rabbits, foxes, time)
+    
+    insights = Insights(
+        max_rabbits=max_rabbits,
+        min_rabbits=min_rabbits,
+        max_foxes=max_foxes,
+        min_foxes=min_foxes,
+        rabbit_peaks=rabbit_peaks,
+        fox_peaks=fox_peaks,
+        avg_rabbit_period=rabbit_period,
+        avg_fox_period=fox_period,
+        phase_lag=phase_lag,
+        final_rabbits=rabbits[-1],
+        final_foxes=foxes[-1],
+        rabbit_argmax=rabbit_argmax,
+        fox_argmax=fox_argmax,
+        # NumPy scalars, so an extinct population gives a NaN
+        # coefficient of variation in the story rather than an error
+        rabbit_mean=np.float64(rabbit_mean),
+        rabbit_std=np.float64(rabbit_std),
+        fox_mean=np.float64(fox_mean),
+        fox_std=np.float64(fox_std),
+        correlation=correlation,
+        drabbit=drabbit,
+        dfox=dfox
+    )
     
     return insights
 
-def create_ecosystem_story(df, insights):
+def create_ecosystem_story(sim, insights):
     """
     Create a human-readable story from the simulation data
     """
     print("🌿 FOREST ECOSYSTEM STORY 🌿")
     print("=" * 50)
     
-    rabbits = df['rabbits'].values
-    foxes = df['foxes'].values
-    time = df['time'].values
-    
-    # Find major events
-    rabbit_max_idx = np.argmax(rabbits)
-    fox_max_idx = np.argmax(foxes)
-    rabbit_min_idx = np.argmin(rabbits)
-    fox_min_idx = np.argmin(foxes)
+    rabbits = sim.rabbits
+    foxes = sim.foxes
+    time = sim.time
     
     print(f"\n🏞️  The forest began with {int(rabbits[0])} rabbits and {int(foxes[0])} foxes.")
     
     # Rabbit population story
     print(f"\n🐇 RABBIT TALE:")
-    print(f"  • Peak population: {int(insights['max_rabbits'])} rabbits at year {int(time[rabbit_max_idx])}")
-    print(f"  • Lowest point: {int(insights['min_rabbits'])} rabbits")
-    print(f"  • Experienced {insights['rabbit_peaks']} major population cycles")
+    print(f"  • Peak population: {int(insights.max_rabbits)} rabbits at year {int(time[insights.rabbit_argmax])}")
+    print(f"  • Lowest point: {int(insights.min_rabbits)} rabbits")
+    print(f"  • Experienced {insights.rabbit_peaks} major population cycles")
     
     # Fox population story
     print(f"\n🦊 FOX CHRONICLES:")
-    print(f"  • Peak population: {int(insights['max_foxes'])} foxes at year {int(time[fox_max_idx])}")
-    print(f"  • Lowest point: {int(insights['min_foxes'])} foxes")
-    print(f"  • Experienced {insights['fox_peaks']} major population cycles")
+    print(f"  • Peak population: {int(insights.max_foxes)} foxes at year {int(time[insights.fox_argmax])}")
+    print(f"  • Lowest point: {int(insights.min_foxes)} foxes")
+    print(f"  • Experienced {insights.fox_peaks} major population cycles")
     
     # Ecological insights
     print(f"\n🔬 ECOLOGICAL PATTERNS:")
-    if insights['phase_lag'] > 0:
-        print(f"  • Fox populations lag {insights['phase_lag']:.1f} years behind rabbits")
-    print(f"  • Average cycle length: {insights['avg_rabbit_period']:.1f} years")
-    print(f"  • Final balance: {int(insights['final_rabbits'])} rabbits, {int(insights['final_foxes'])} foxes")
+    if insights.phase_lag > 0:
+        print(f"  • Fox populations lag {insights.phase_lag:.1f} years behind rabbits")
+    print(f"  • Average cycle length: {insights.avg_rabbit_period:.1f} years")
+    print(f"  • Final balance: {int(insights.final_rabbits)} rabbits, {int(insights.final_foxes)} foxes")
     
     # Stability assessment
-    rabbit_var = np.std(rabbits) / np.mean(rabbits)
-    fox_var = np.std(foxes) / np.mean(foxes)
+    rabbit_var = insights.rabbit_std / insights.rabbit_mean
+    fox_var = insights.fox_std / insights.fox_mean
     
     if rabbit_var < 0.3 and fox_var < 0.3:
         stability = "stable equilibrium"
@@ -138,15 +378,17 @@ def create_ecosystem_story(df, insights):
     
     print(f"  • Ecosystem shows {stability}")
 
-def plot_ecosystem_dynamics(df, insights):
+def plot_ecosystem_dynamics(sim, insights):
     """
     Create comprehensive plots of the ecosystem dynamics
     """
+    import matplotlib.pyplot as plt
+    
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
-    time = df['time'].values
-    rabbits = df['rabbits'].values
-    foxes = df['foxes'].values
+    time = sim.time
+    rabbits = sim.rabbits
+    foxes = sim.foxes
     
     # Population over time
     axes[0,0].plot(time, rabbits, 'g-', linewidth=2, label='Rabbits', alpha=0.8)
@@ -168,8 +410,15 @@ def plot_ecosystem_dynamics(df, insights):
     axes[0,1].grid(True, alpha=0.3)
     
     # Population distributions
-    axes[1,0].hist(rabbits, bins=30, alpha=0.7, color='green', label='Rabbits')
-    axes[1,0].hist(foxes, bins=30, alpha=0.7, color='red', label='Foxes')
+    # Shared bin edges from the extrema already found by the analysis
+    edges = np.linspace(min(insights.min_rabbits, insights.min_foxes),
+                        max(insights.max_rabbits, insights.max_foxes), 31)
+    widths = np.diff(edges)
+    rabbit_counts, _ = np.histogram(rabbits, edges)
+    fox_counts, _ = np.histogram(foxes, edges)
+    
+    axes[1,0].bar(edges[:-1], rabbit_counts, width=widths, align='edge', alpha=0.7, color='green', label='Rabbits')
+    axes[1,0].bar(edges[:-1], fox_counts, width=widths, align='edge', alpha=0.7, color='red', label='Foxes')
     axes[1,0].set_xlabel('Population')
     axes[1,0].set_ylabel('Frequency')
     axes[1,0].set_title('Population Distributions')
@@ -177,11 +426,14 @@ def plot_ecosystem_dynamics(df, insights):
     axes[1,0].grid(True, alpha=0.3)
     
     # Rate of change analysis
-    rabbit_change = np.diff(rabbits)
-    fox_change = np.diff(foxes)
-    
-    axes[1,1].scatter(rabbits[:-1], rabbit_change, alpha=0.5, color='green', s=1, label='Rabbit Change')
-    axes[1,1].scatter(foxes[:-1], fox_change, alpha=0.5, color='red', s=1, label='Fox Change')
+    rabbit_change = insights.drabbit
+    fox_change = insights.dfox
+    
+    # Decimate to ~500 points and draw markers with plot, which is much
+    # cheaper than scatter's per-point collection
+    stride = max(1, len(rabbits) // 500)
+    axes[1,1].plot(rabbits[:-1:stride], rabbit_change[::stride], '.', markersize=1, alpha=0.5, color='green', label='Rabbit Change')
+    axes[1,1].plot(foxes[:-1:stride], fox_change[::stride], '.', markersize=1, alpha=0.5, color='red', label='Fox Change')
     axes[1,1].axhline(y=0, color='k', linestyle='--', alpha=0.5)
     axes[1,1].set_xlabel('Population')
     axes[1,1].set_ylabel('Population Change Rate')
@@ -196,6 +448,8 @@ def compare_ecosystem_scenarios():
     """
     Compare different ecosystem scenarios
     """
+    import matplotlib.pyplot as plt
+    
     scenarios = {
         'Balanced Forest': (40, 9, 0.1, 0.02, 0.01, 0.1),
         'Rabbit Paradise': (100, 5, 0.15, 0.01, 0.005, 0.1),
@@ -203,14 +457,18 @@ def compare_ecosystem_scenarios():
         'Fragile Balance': (30, 12, 0.12, 0.025, 0.015, 0.12)
     }
     
+    duration, steps = 200, 1000
+    time = np.linspace(0, duration, steps)
+    solutions = simulate_ecosystem_batch(list(scenarios.values()), duration, steps)
+    
     plt.figure(figsize=(15, 10))
     
     for i, (scenario_name, params) in enumerate(scenarios.items(), 1):
-        df = simulate_ecosystem(*params)
+        solution = solutions[i - 1]
         
         plt.subplot(2, 2, i)
-        plt.plot(df['time'], df['rabbits'], 'g-', label='Rabbits', alpha=0.8)
-        plt.plot(df['time'], df['foxes'], 'r-', label='Foxes', alpha=0.8)
+        plt.plot(time, solution[:, 0], 'g-', label='Rabbits', alpha=0.8)
+        plt.plot(time, solution[:, 1], 'r-', label='Foxes', alpha=0.8)
         plt.title(f'{scenario_name}\nR:{params[0]}, F:{params[1]}')
         plt.xlabel('Years')
         plt.ylabel('Population')
@@ -220,6 +478,14 @@ def compare_ecosystem_scenarios():
     plt.tight_layout()
     plt.show()
 
+def describe_population(values):
+    """
+    Summary statistics for one population series, in the order
+    count, mean, std, min, 25%, 50%, 75%, max
+    """
+    q0, q25, q50, q75, q100 = np.percentile(values, [0, 25, 50, 75, 100])
+    return (len(values), values.mean(), values.std(ddof=1), q0, q25, q50, q75, q100)
+
 def main():
     """
     Main function to run the ecosystem simulation
@@ -228,14 +494,14 @@ def main():
     print("Simulating the delicate balance between rabbits and foxes...\n")
     
     # Run main simulation
-    df = simulate_ecosystem()
-    insights = analyze_ecosystem_dynamics(df)
+    sim = simulate_ecosystem()
+    insights = analyze_ecosystem_dynamics(sim)
     
     # Tell the story
-    create_ecosystem_story(df, insights)
+    create_ecosystem_story(sim, insights)
     
     # Create plots
-    plot_ecosystem_dynamics(df, insights)
+    plot_ecosystem_dynamics(sim, insights)
     
     # Show comparison of different scenarios
     print("\n" + "="*50)
@@ -246,10 +512,20 @@ def main():
     # Statistical summary
     print("\n📊 STATISTICAL SUMMARY")
     print("="*30)
-    print(df[['rabbits', 'foxes']].describe().round(2))
+    labels = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    columns = {
+        'rabbits': [f"{v:.2f}" for v in describe_population(sim.rabbits)],
+        'foxes': [f"{v:.2f}" for v in describe_population(sim.foxes)]
+    }
+    widths = {name: max(len(name), *map(len, cells)) for name, cells in columns.items()}
+    label_width = max(map(len, labels))
+    
+    print(" " * label_width + "".join(f"  {name:>{widths[name]}}" for name in columns))
+    for row, label in enumerate(labels):
+        print(f"{label:<{label_width}}" + "".join(f"  {cells[row]:>{widths[name]}}" for name, cells in columns.items()))
     
     # Correlation analysis
-    correlation = np.corrcoef(df['rabbits'], df['foxes'])[0,1]
+    correlation = insights.correlation
     print(f"\n📈 Population Correlation: {correlation:.3f}")
     if correlation < 0:
         print("   (Negative correlation: typical predator-prey dynamics)")